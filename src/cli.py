@@ -0,0 +1,217 @@
+"""
+🖥️ Hong Kong Temperature Art - Command Line Interface
+One entry point for every renderer, with headless and batch modes
+
+Examples:
+    python cli.py chart --no-show
+    python cli.py chart --refresh 60 --output live.png --no-show
+    python cli.py fractal --width 600 --height 450 --max-iter 100 --workers 4
+    python cli.py fractal --width 400 --height 300 --dpi 40 --no-show  # ~760x610 PNG
+    python cli.py heatmap --method rbf --no-show
+    python cli.py fractal --station-field --no-show
+    python cli.py julia --width 200 --height 200 --workers 4 --no-show
+    python cli.py animation --output julia.gif --no-show
+    python cli.py --batch jobs.json --no-show
+
+A batch manifest is a JSON list of jobs. Each job is an object using the same
+option names as the command line (``mode``, ``width``, ``max_iter``, ...);
+options a job leaves out fall back to the command line values, and jobs
+without an ``output`` are saved as ``<mode>_<index>.png`` (``.gif`` for
+animations):
+
+    [
+        {"mode": "chart", "output": "chart.png"},
+        {"mode": "fractal", "width": 1200, "height": 900, "output": "fractal.png"}
+    ]
+
+A job that cannot render (for example heatmap or --station-field with no
+station readings) is reported, the remaining jobs still run, and the command
+exits with status 1.
+"""
+
+import argparse
+import json
+import sys
+
+import matplotlib.pyplot as plt
+
+import engines
+import hk_temperature_chart
+import julia
+import mandelbrot
+import station_field
+from data_fetcher import fetch_hk_station_temperatures
+
+MODES = ['chart', 'fractal', 'heatmap', 'julia', 'animation']
+
+def build_parser():
+    """Command line options shared by every mode"""
+    parser = argparse.ArgumentParser(
+        description="Render Hong Kong temperature charts and fractal art")
+    parser.add_argument('mode', nargs='?', choices=MODES, default='chart',
+                        help="What to render (default: chart)")
+    parser.add_argument('--width', type=int, default=None,
+                        help="Width in pixels: of the saved image in chart mode and of "
+                             "each animation frame (400); of the computed grid in fractal "
+                             "(1200), heatmap (400) and julia (300 per panel) modes, "
+                             "whose saved size is set by --figsize and --dpi")
+    parser.add_argument('--height', type=int, default=None,
+                        help="Height in pixels, with the same meaning per mode as --width "
+                             "(fractal: 900, heatmap: 300, julia: 300, animation: 400)")
+    parser.add_argument('--figsize', type=float, nargs=2, metavar=('W', 'H'), default=None,
+                        help="Figure size in inches for fractal (20 16), heatmap (14 10) "
+                             "and julia (24 16) modes, whose text is laid out for those "
+                             "defaults; the saved image is about W*dpi x H*dpi pixels, "
+                             "so change --dpi to resize it without crowding")
+    parser.add_argument('--max-iter', type=int, default=150,
+                        help="Maximum fractal iterations per pixel (default: 150)")
+    parser.add_argument('--dpi', type=int, default=300,
+                        help="Resolution of the saved image (default: 300); chart mode "
+                             "derives it from --width/--height when given, animation "
+                             "frames are always --width x --height pixels")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Worker processes for fractal computation; ignored by the "
+                             "compiled engine, which is already multi-threaded (default: 1)")
+    parser.add_argument('--engine', choices=engines.ENGINE_NAMES, default='numpy',
+                        help="Fractal iteration engine; compiled needs Numba and "
+                             "falls back to numpy without it (default: numpy)")
+    parser.add_argument('--method', choices=station_field.METHODS, default='idw',
+                        help="Station interpolation for heatmaps (default: idw); idw "
+                             "matches every station reading, rbf is smoother but can "
+                             "sit about a degree off a station")
+    parser.add_argument('--station-field', action='store_true',
+                        help="Fractal mode: use the multi-station field as the overlay")
+    parser.add_argument('--refresh', type=float, metavar='SECONDS', default=None,
+                        help="Chart mode: keep refreshing every SECONDS, "
+                             "re-rendering only what changed")
+    parser.add_argument('--output', '-o', default=None,
+                        help="Output filename (default: timestamped PNG)")
+    parser.add_argument('--no-show', dest='show', action='store_false',
+                        help="Headless mode: save without opening a window")
+    parser.add_argument('--batch', metavar='MANIFEST', default=None,
+                        help="JSON manifest of jobs to render in one process")
+    return parser
+
+class DataCache:
+    """Fetch weather data at most once per process, shared across batch jobs"""
+
+    def __init__(self):
+        self._hourly = None
+        self._current = None
+        self._stations = None
+
+    def hourly(self):
+        if self._hourly is None:
+            self._hourly = hk_temperature_chart.fetch_hk_hourly_temperature()
+        return self._hourly
+
+    def current_temp(self):
+        if self._current is None:
+            self._current = mandelbrot.fetch_hk_temperature()
+        return self._current
+
+    def stations(self):
+        if self._stations is None:
+            self._stations = fetch_hk_station_temperatures()
+        return self._stations
+
+def run_job(job, cache):
+    """Render a single job described by a namespace of CLI options"""
+    if job.mode == 'chart' and job.refresh:
+        return hk_temperature_chart.watch_temperature(
+            interval=job.refresh, width=job.width, height=job.height,
+            dpi=job.dpi, output=job.output, show=job.show)
+
+    if job.mode == 'chart':
+        return hk_temperature_chart.main(
+            width=job.width, height=job.height, dpi=job.dpi,
+            output=job.output, show=job.show, data=cache.hourly())
+
+    if job.mode == 'fractal':
+        readings = cache.stations() if job.station_field else None
+        if job.station_field and not readings:
+            raise ValueError("--station-field needs station readings, "
+                             "but none are available")
+        return mandelbrot.main(
+            width=job.width or 1200, height=job.height or 900,
+            max_iter=job.max_iter, dpi=job.dpi, engine=job.engine,
+            workers=job.workers, output=job.output, show=job.show,
+            current_temp=cache.current_temp(),
+            station_readings=readings,
+            field_method=job.method, figsize=tuple(job.figsize or (20, 16)))
+
+    if job.mode == 'heatmap':
+        return station_field.main(
+            width=job.width or 400, height=job.height or 300,
+            method=job.method, dpi=job.dpi, output=job.output,
+            show=job.show, readings=cache.stations(),
+            figsize=tuple(job.figsize or (14, 10)))
+
+    if job.mode in ('julia', 'animation'):
+        return julia.main(
+            width=job.width, height=job.height, max_iter=job.max_iter,
+            dpi=job.dpi, engine=job.engine, workers=job.workers,
+            output=job.output, show=job.show,
+            current_temp=cache.current_temp(), animate=job.mode == 'animation',
+            figsize=tuple(job.figsize or (24, 16)))
+
+    raise ValueError(f"Unknown mode '{job.mode}', choose from {MODES}")
+
+def load_manifest(path, defaults):
+    """Read a batch manifest and merge each job over the CLI defaults"""
+    with open(path) as f:
+        entries = json.load(f)
+
+    if not isinstance(entries, list):
+        raise ValueError(f"Batch manifest {path} must contain a JSON list of jobs")
+
+    jobs = []
+    for index, entry in enumerate(entries):
+        options = vars(defaults).copy()
+        # Accept both "max_iter" and the command line spelling "max-iter"
+        options.update({key.replace('-', '_'): value for key, value in entry.items()})
+        unknown = set(options) - set(vars(defaults))
+        if unknown:
+            raise ValueError(f"Unknown option(s) in batch job: {sorted(unknown)}")
+        if options['mode'] not in MODES:
+            raise ValueError(f"Unknown mode '{options['mode']}', choose from {MODES}")
+        # Timestamped default names would collide within a batch
+        if options['output'] is None:
+            extension = 'gif' if options['mode'] == 'animation' else 'png'
+            options['output'] = f"{options['mode']}_{index:03d}.{extension}"
+        jobs.append(argparse.Namespace(**options))
+    return jobs
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if not args.show:
+        # Non-interactive backend so headless jobs never block on a window
+        plt.switch_backend('Agg')
+
+    jobs = load_manifest(args.batch, args) if args.batch else [args]
+
+    cache = DataCache()
+    outputs = []
+    failures = []
+    for job in jobs:
+        # One failed job (e.g. no station readings) must not sink the batch,
+        # but it must not pass for a rendered output either
+        try:
+            outputs.append(run_job(job, cache))
+        except ValueError as e:
+            print(f"Error: {job.mode} job failed: {e}", file=sys.stderr)
+            failures.append(job)
+
+    if len(jobs) > 1:
+        print(f"Batch complete: {len(outputs)} outputs rendered, {len(failures)} failed")
+        for output in outputs:
+            print(f"   {output}")
+        for job in failures:
+            print(f"   FAILED {job.mode} -> {job.output}")
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
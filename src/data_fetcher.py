@@ -44,6 +44,34 @@ def fetch_hk_temperature():
         print(f"Error fetching temperature data: {e}")
         return 25  # Default temperature in Celsius
 
+def fetch_hk_station_temperatures():
+    """
+    Fetch the latest temperature reading from every reporting station
+    Returns a dict mapping station name to temperature in Celsius,
+    or an empty dict if the API is unavailable
+    """
+    API_ENDPOINT = "https://data.weather.gov.hk/weatherAPI/opendata/weather.php?dataType=rhrread&lang=en"
+    
+    try:
+        response = requests.get(API_ENDPOINT, timeout=5)
+        if response.status_code == 200:
+            data = response.json()
+            temp_data = data.get('temperature', {}).get('data', [])
+            
+            readings = {}
+            for station in temp_data:
+                place = station.get('place')
+                temp = station.get('value')
+                if place and temp is not None:
+                    readings[place] = float(temp)
+            return readings
+        
+        print("Warning: Could not fetch station temperatures")
+        return {}
+    except Exception as e:
+        print(f"Error fetching station temperatures: {e}")
+        return {}
+
 def get_temperature_category(temp):
     """
     Categorize temperature into different ranges
@@ -1,3 +1,4 @@
+import time
 import requests
 import matplotlib.pyplot as plt
 import pandas as pd
@@ -6,10 +7,20 @@ import numpy as np
 import matplotlib.dates as mdates
 from matplotlib.patches import Circle, Rectangle, Polygon
 from matplotlib.colors import LinearSegmentedColormap, to_rgba
+from matplotlib.transforms import Bbox
+from matplotlib.collections import PolyCollection
 import seaborn as sns
 
+# Today's hourly values from earlier fetches in this process: {date: {hour: temp}}
+_DAY_HISTORY = {}
+
 def fetch_hk_hourly_temperature():
-    """Fetch hourly temperature data from Hong Kong Observatory API"""
+    """
+    Fetch hourly temperature data from Hong Kong Observatory API
+    Hours already filled by an earlier fetch today keep their value and the
+    current hour takes the live reading, so repeated fetches during the day
+    differ only at the current hour
+    """
     try:
         # Get current weather data with hourly readings
         api_url = "https://data.weather.gov.hk/weatherAPI/opendata/weather.php"
@@ -48,6 +59,10 @@ def fetch_hk_hourly_temperature():
             
             # Create hourly data for today (24 hours)
             base_time = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
+            day_noise = np.random.default_rng(int(base_time.strftime('%Y%m%d'))).normal(0, 0.5, 24)
+            history = _DAY_HISTORY.setdefault(base_time.date(), {})
+            for day in [d for d in _DAY_HISTORY if d != base_time.date()]:
+                del _DAY_HISTORY[day]
             
             if current_temp:
                 # Simulate realistic daily temperature pattern for Hong Kong
@@ -66,14 +81,16 @@ def fetch_hk_hourly_temperature():
                     else:  # Evening cooling
                         temp_offset = 1 - (hour-18) * 0.5
                     
-                    # Add some random variation
-                    temp_offset += np.random.normal(0, 0.5)
+                    # Add some random variation, fixed for the day
+                    temp_offset += day_noise[hour]
                     
-                    # For current hour, use actual temperature
+                    # For current hour, use actual temperature; other hours
+                    # keep whatever an earlier fetch today gave them
                     if hour == current_time.hour:
-                        temperatures.append(current_temp)
-                    else:
-                        temperatures.append(current_temp + temp_offset)
+                        history[hour] = current_temp
+                    elif hour not in history:
+                        history[hour] = current_temp + temp_offset
+                    temperatures.append(history[hour])
             
             return times, temperatures, current_temp, current_humidity
         
@@ -83,41 +100,179 @@ def fetch_hk_hourly_temperature():
         print(f"Error fetching temperature data: {e}")
         return None, None, None, None
 
-def create_temperature_visualization(times, temperatures, current_temp, humidity):
-    """Create an ultra-beautiful, creative temperature visualization"""
-    
-    # 🎨 Custom beautiful color palette
-    colors = {
-        'background': '#0a0a0a',
-        'surface': '#1a1a1a', 
-        'primary': '#ff6b6b',
-        'secondary': '#4ecdc4',
-        'accent': '#ffe66d',
-        'cool': '#74b9ff',
-        'warm': '#fd79a8',
-        'peak': '#e17055',
-        'glow': '#ffffff'
-    }
+# 🎨 Custom beautiful color palette
+CHART_COLORS = {
+    'background': '#0a0a0a',
+    'surface': '#1a1a1a', 
+    'primary': '#ff6b6b',
+    'secondary': '#4ecdc4',
+    'accent': '#ffe66d',
+    'cool': '#74b9ff',
+    'warm': '#fd79a8',
+    'peak': '#e17055',
+    'glow': '#ffffff'
+}
+
+def temp_to_color(temp, temp_min, temp_max):
+    """Map temperature to beautiful gradient colors"""
+    norm_temp = (temp - temp_min) / (temp_max - temp_min) if temp_max != temp_min else 0.5
+    if norm_temp < 0.3:
+        return CHART_COLORS['cool']  # Cool temps = blue
+    elif norm_temp < 0.7:
+        return CHART_COLORS['warm']  # Medium temps = pink
+    else:
+        return CHART_COLORS['peak']  # Hot temps = orange-red
+
+def make_callout_text(current_temp, current_time):
+    """Text for the current temperature callout box"""
+    return f"RIGHT NOW\n{current_temp:.1f}°C\n{current_time.strftime('%H:%M')}"
+
+def make_dashboard_text(current_temp, temp_min, temp_max, temp_avg, humidity, current_time):
+    """Text for the statistics dashboard box"""
+    dashboard_text = f"""TEMPERATURE INSIGHTS
+━━━━━━━━━━━━━━━━━━━━━━━━
+Now: {current_temp:.1f}°C
+Peak: {temp_max:.1f}°C  
+Low: {temp_min:.1f}°C
+Average: {temp_avg:.1f}°C
+Range: {temp_max - temp_min:.1f}°C"""
+    
+    if humidity:
+        dashboard_text += f"\nHumidity: {humidity}%"
+    
+    dashboard_text += f"\nUpdated: {current_time.strftime('%H:%M:%S')}"
+    dashboard_text += f"\n━━━━━━━━━━━━━━━━━━━━━━━━"
+    return dashboard_text
+
+def draw_temperature_zones(ax, times, temp_min, temp_max, temp_avg):
+    """Draw the peak and cool zones, returning their (span, label) artists"""
+    colors = CHART_COLORS
+    zones = []
+    
+    # Peak temperature zone with flame effect
+    if temp_max > temp_avg + 1:
+        peak_y = temp_max - 0.5
+        zones.append(ax.axhspan(peak_y, temp_max + 1, 
+                               alpha=0.15, color=colors['peak'], zorder=1))
+        zones.append(ax.text(times[len(times)//2], peak_y + 0.2, "PEAK ZONE", 
+                            ha='center', fontsize=12, color=colors['peak'], 
+                            fontweight='bold', alpha=0.8))
+    
+    # Cool zone with snowflake effect
+    if temp_min < temp_avg - 1:
+        cool_y = temp_min + 0.5
+        zones.append(ax.axhspan(temp_min - 1, cool_y, 
+                               alpha=0.15, color=colors['cool'], zorder=1))
+        zones.append(ax.text(times[len(times)//2], temp_min + 0.2, "COOL ZONE", 
+                            ha='center', fontsize=12, color=colors['cool'], 
+                            fontweight='bold', alpha=0.8))
+    
+    return zones
+
+# Longest time span still labelled with fixed hourly ticks
+MAX_HOURLY_TICK_SPAN = timedelta(hours=36)
+
+# Above this many drawn points the fill becomes a single collection and the
+# particles are thinned, so draw cost stops growing with the series
+MAX_DETAIL_POINTS = 200
+MAX_PARTICLES = 48
+
+# Fraction of the figure width taken by the plot area (see subplots_adjust)
+PLOT_WIDTH_FRACTION = 0.96 - 0.08
+
+_LOD_CACHE = {}
+_LOD_CACHE_SIZE = 32
+
+def lod_point_budget(figsize, dpi):
+    """Number of points worth drawing: one per pixel column of the plot area"""
+    return int(figsize[0] * dpi * PLOT_WIDTH_FRACTION)
+
+def lttb_indices(x, y, threshold):
+    """
+    Largest-Triangle-Three-Buckets downsampling
+    Returns sorted indices of at most threshold points (plus the global
+    peak and low, which are always kept) that preserve the visual shape
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    every = (n - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        
+        # Pick the point in this bucket forming the largest triangle with
+        # the last chosen point and the average of the next bucket
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    
+    # Peaks and lows must survive exactly
+    return np.union1d(indices, [np.argmax(y), np.argmin(y)])
+
+def decimate_series(times, temperatures, threshold):
+    """
+    Downsample a time series for drawing, cached per (series, threshold)
+    The cache key only looks at the readings and the span of the times, so
+    a hit never converts the full list of timestamps
+    """
+    if len(temperatures) <= threshold:
+        return times, temperatures
+    
+    y = np.asarray(temperatures, dtype=float)
+    key = (len(times), times[0], times[-1], hash(y.tobytes()), threshold)
+    
+    indices = _LOD_CACHE.get(key)
+    if indices is None:
+        indices = lttb_indices(mdates.date2num(times), y, threshold)
+        if len(_LOD_CACHE) >= _LOD_CACHE_SIZE:
+            _LOD_CACHE.pop(next(iter(_LOD_CACHE)))
+        _LOD_CACHE[key] = indices
+    
+    return [times[i] for i in indices], [temperatures[i] for i in indices]
+
+def create_temperature_visualization(times, temperatures, current_temp, humidity,
+                                     figsize=(18, 10), dpi=150, return_artists=False,
+                                     lod=True, output_dpi=None):
+    """
+    Create an ultra-beautiful, creative temperature visualization
+    With return_artists=True also returns a dict of the data-dependent
+    artists, used by IncrementalTemperatureChart to update them in place.
+    With lod=True series longer than the plot's pixel width in the saved
+    output (figsize at output_dpi, which defaults to dpi) are downsampled
+    (LTTB, keeping the peak and low) before drawing.
+    """
+    
+    colors = CHART_COLORS
     
     # 🎭 Create stunning figure with perfect proportions
-    fig, ax = plt.subplots(figsize=(18, 10), dpi=150)
+    fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
     fig.patch.set_facecolor(colors['background'])
     ax.set_facecolor(colors['surface'])
     
     # 📊 Prepare data
-    df = pd.DataFrame({'time': times, 'temperature': temperatures})
     temp_min, temp_max, temp_avg = min(temperatures), max(temperatures), np.mean(temperatures)
     
+    # Level of detail: statistics above use every reading, but there is no
+    # point drawing more vertices than the plot has pixel columns
+    if lod:
+        times, temperatures = decimate_series(list(times), list(temperatures),
+                                              lod_point_budget(figsize, output_dpi or dpi))
+    
     # 🌟 CREATIVE ELEMENT 1: Dynamic Temperature-Based Colors
     def get_temp_color(temp):
-        """Map temperature to beautiful gradient colors"""
-        norm_temp = (temp - temp_min) / (temp_max - temp_min) if temp_max != temp_min else 0.5
-        if norm_temp < 0.3:
-            return colors['cool']  # Cool temps = blue
-        elif norm_temp < 0.7:
-            return colors['warm']  # Medium temps = pink
-        else:
-            return colors['peak']  # Hot temps = orange-red
+        return temp_to_color(temp, temp_min, temp_max)
     
     # 🎨 CREATIVE ELEMENT 2: Multi-Layer Visual Depth
     
@@ -126,78 +281,87 @@ def create_temperature_visualization(times, temperatures, current_temp, humidity
     for i in range(5):
         alpha = 0.03 - i * 0.005
         offset = i * 0.3
-        ax.fill_between(times, [temp_min - 1 - offset] * len(times), 
-                       [temp_max + 1 + offset] * len(times),
+        ax.fill_between([times[0], times[-1]], [temp_min - 1 - offset] * 2, 
+                       [temp_max + 1 + offset] * 2,
                        alpha=alpha, color=colors['secondary'])
     
     # 🌈 CREATIVE ELEMENT 3: Rainbow Temperature Gradient Fill
     # Create segments with individual colors
-    for i in range(len(times) - 1):
-        temp_color = get_temp_color(temperatures[i])
-        ax.fill_between(times[i:i+2], temperatures[i:i+2], 
-                       alpha=0.4, color=temp_color)
+    detailed = len(times) <= MAX_DETAIL_POINTS
+    segments = []
+    if detailed:
+        for i in range(len(times) - 1):
+            temp_color = get_temp_color(temperatures[i])
+            segments.append(ax.fill_between(times[i:i+2], temperatures[i:i+2], 
+                                            alpha=0.4, color=temp_color))
+    else:
+        # Long series: the same per-segment quads and colours, but as one
+        # collection drawn in a single pass instead of an artist per segment
+        x = mdates.date2num(times)
+        y = np.asarray(temperatures, dtype=float)
+        verts = np.stack([np.column_stack([x[:-1], np.zeros(len(y) - 1)]),
+                          np.column_stack([x[:-1], y[:-1]]),
+                          np.column_stack([x[1:], y[1:]]),
+                          np.column_stack([x[1:], np.zeros(len(y) - 1)])], axis=1)
+        segment_colors = [get_temp_color(t) for t in temperatures[:-1]]
+        segments.append(ax.add_collection(PolyCollection(
+            verts, facecolors=segment_colors, edgecolors=segment_colors, alpha=0.4)))
     
     # ✨ CREATIVE ELEMENT 4: Glowing Main Line with Particles
     
     # Main temperature curve with glow effect
+    glow_lines = []
     for width, alpha in [(8, 0.3), (6, 0.5), (4, 0.7), (3, 0.9)]:
-        ax.plot(times, temperatures, 
-                color=colors['primary'], linewidth=width, alpha=alpha, 
-                solid_capstyle='round')
+        glow_lines += ax.plot(times, temperatures, 
+                              color=colors['primary'], linewidth=width, alpha=alpha, 
+                              solid_capstyle='round')
     
     # Temperature particles - floating dots at each data point
-    temp_colors = [get_temp_color(t) for t in temperatures]
-    scatter = ax.scatter(times, temperatures, 
+    particle_times, particle_temps = times, temperatures
+    if not detailed:
+        # A dot per point would be a solid wall; keep an even sample plus
+        # the peak and low
+        picks = np.union1d(np.linspace(0, len(times) - 1, MAX_PARTICLES).round().astype(int),
+                           [np.argmax(temperatures), np.argmin(temperatures)])
+        particle_times = [times[i] for i in picks]
+        particle_temps = [temperatures[i] for i in picks]
+    temp_colors = [get_temp_color(t) for t in particle_temps]
+    scatter = ax.scatter(particle_times, particle_temps, 
                         c=temp_colors, s=120, alpha=0.9, 
                         edgecolors=colors['glow'], linewidths=2, 
                         zorder=10)
     
     # 🎯 CREATIVE ELEMENT 5: Dynamic Temperature Zones with Icons
-    
-    # Peak temperature zone with flame effect
-    if temp_max > temp_avg + 1:
-        peak_y = temp_max - 0.5
-        ax.axhspan(peak_y, temp_max + 1, 
-                  alpha=0.15, color=colors['peak'], zorder=1)
-        ax.text(times[len(times)//2], peak_y + 0.2, "PEAK ZONE", 
-               ha='center', fontsize=12, color=colors['peak'], 
-               fontweight='bold', alpha=0.8)
-    
-    # Cool zone with snowflake effect
-    if temp_min < temp_avg - 1:
-        cool_y = temp_min + 0.5
-        ax.axhspan(temp_min - 1, cool_y, 
-                  alpha=0.15, color=colors['cool'], zorder=1)
-        ax.text(times[len(times)//2], temp_min + 0.2, "COOL ZONE", 
-               ha='center', fontsize=12, color=colors['cool'], 
-               fontweight='bold', alpha=0.8)
+    zones = draw_temperature_zones(ax, times, temp_min, temp_max, temp_avg)
     
     # 🕐 CREATIVE ELEMENT 6: Stunning Current Time Indicator
     current_time = datetime.now()
     
     # Animated-style current time line with glow
+    now_lines = []
     for width, alpha in [(6, 0.2), (4, 0.4), (2, 0.8)]:
-        ax.axvline(x=current_time, color=colors['accent'], 
-                  linewidth=width, alpha=alpha, zorder=8)
+        now_lines.append(ax.axvline(x=current_time, color=colors['accent'], 
+                                    linewidth=width, alpha=alpha, zorder=8))
     
     # Ultra-beautiful current temperature callout
+    callout = None
     if current_temp:
         # Create a beautiful callout box
-        callout_text = f"RIGHT NOW\n{current_temp:.1f}°C\n{current_time.strftime('%H:%M')}"
+        callout_text = make_callout_text(current_temp, current_time)
         
         # Glowing annotation with perfect styling
-        ax.annotate(callout_text, 
-                   xy=(current_time, current_temp), 
-                   xytext=(40, 50), textcoords='offset points',
-                   bbox=dict(boxstyle='round,pad=1.2', 
-                           facecolor=colors['accent'], alpha=0.95,
-                           edgecolor=colors['glow'], linewidth=3),
-                   arrowprops=dict(arrowstyle='->', 
-                                 connectionstyle='arc3,rad=0.3',
-                                 color=colors['glow'], linewidth=3),
-                   fontsize=14, fontweight='bold', 
-                   color='black', ha='center', va='center',
-                   zorder=15)
+        callout = ax.annotate(callout_text, 
+                             xy=(current_time, current_temp), 
+                             xytext=(40, 50), textcoords='offset points',
+                             bbox=dict(boxstyle='round,pad=1.2', 
+                                     facecolor=colors['accent'], alpha=0.95,
+                                     edgecolor=colors['glow'], linewidth=3),
+                             arrowprops=dict(arrowstyle='->', 
+                                           connectionstyle='arc3,rad=0.3',
+                                           color=colors['glow'], linewidth=3),
+                             fontsize=14, fontweight='bold', 
+                             color='black', ha='center', va='center',
+                             zorder=15)
     
     # CREATIVE ELEMENT 7: Artistic Typography & Layout
     
@@ -228,39 +392,36 @@ def create_temperature_visualization(times, temperatures, current_temp, humidity
            color=colors['secondary'], linewidth=0.5)
     
     # Perfect time formatting
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-    ax.xaxis.set_major_locator(mdates.HourLocator(interval=2))
-    ax.xaxis.set_minor_locator(mdates.HourLocator(interval=1))
-    
-    plt.setp(ax.xaxis.get_majorticklabels(), 
-             rotation=45, ha='right', fontsize=11, color='lightgray')
+    if times[-1] - times[0] <= MAX_HOURLY_TICK_SPAN:
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
+        ax.xaxis.set_major_locator(mdates.HourLocator(interval=2))
+        ax.xaxis.set_minor_locator(mdates.HourLocator(interval=1))
+        
+        plt.setp(ax.xaxis.get_majorticklabels(), 
+                 rotation=45, ha='right', fontsize=11, color='lightgray')
+    else:
+        # Fixed hourly ticks would grow with the span (and eventually exceed
+        # Locator.MAXTICKS); let matplotlib pick a readable date scale
+        locator = mdates.AutoDateLocator()
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        ax.tick_params(axis='x', labelsize=11, labelcolor='lightgray')
     plt.setp(ax.yaxis.get_majorticklabels(), 
              fontsize=11, color='lightgray')
     
     # 💎 CREATIVE ELEMENT 9: Statistics Dashboard Art
     
-    dashboard_text = f"""TEMPERATURE INSIGHTS
-━━━━━━━━━━━━━━━━━━━━━━━━
-Now: {current_temp:.1f}°C
-Peak: {temp_max:.1f}°C  
-Low: {temp_min:.1f}°C
-Average: {temp_avg:.1f}°C
-Range: {temp_max - temp_min:.1f}°C"""
-    
-    if humidity:
-        dashboard_text += f"\nHumidity: {humidity}%"
-    
-    dashboard_text += f"\nUpdated: {current_time.strftime('%H:%M:%S')}"
-    dashboard_text += f"\n━━━━━━━━━━━━━━━━━━━━━━━━"
+    dashboard_text = make_dashboard_text(current_temp, temp_min, temp_max, temp_avg,
+                                         humidity, current_time)
     
     # Beautiful dashboard box
-    ax.text(0.02, 0.98, dashboard_text, transform=ax.transAxes, 
-           verticalalignment='top', 
-           bbox=dict(boxstyle='round,pad=1', 
-                    facecolor=colors['surface'], alpha=0.9,
-                    edgecolor=colors['accent'], linewidth=2),
-           color=colors['glow'], fontsize=10, family='monospace',
-           zorder=12)
+    dashboard = ax.text(0.02, 0.98, dashboard_text, transform=ax.transAxes, 
+                       verticalalignment='top', 
+                       bbox=dict(boxstyle='round,pad=1', 
+                                facecolor=colors['surface'], alpha=0.9,
+                                edgecolor=colors['accent'], linewidth=2),
+                       color=colors['glow'], fontsize=10, family='monospace',
+                       zorder=12)
     
     # 🖼️ CREATIVE ELEMENT 10: Perfect Frame
     
@@ -274,16 +435,348 @@ Range: {temp_max - temp_min:.1f}°C"""
     plt.tight_layout()
     plt.subplots_adjust(top=0.87, bottom=0.12, left=0.08, right=0.96)
     
+    if return_artists:
+        artists = {
+            'ax': ax,
+            'segments': segments,
+            'glow_lines': glow_lines,
+            'scatter': scatter,
+            'zones': zones,
+            'now_lines': now_lines,
+            'callout': callout,
+            'dashboard': dashboard,
+        }
+        return fig, artists
+    
     return fig
 
-def main():
+class IncrementalTemperatureChart:
+    """
+    Keeps the last rendered chart and updates it in place on refresh
+    
+    Every artist that depends on the readings (fill segments, glow lines,
+    particles, zones, current time line, callout and dashboard) is drawn as
+    an animated layer over a cached background holding the frame, grid,
+    titles and atmosphere. A refresh only feeds new data to the artists
+    touched by changed readings, redraws the animated layer over the cached
+    background and blits the dirty region. Anything that would change the
+    axes or layout (new timestamps, a new day's minimum or maximum, which
+    sets the atmosphere bands, zones and view, values outside the view, a
+    new day, zones appearing or disappearing) falls back to a full render.
+    """
+    
+    def __init__(self, figsize=(18, 10), dpi=150, save_kwargs=None):
+        self.figsize = figsize
+        self.dpi = dpi
+        # savefig options for save(), as returned by chart_output_settings
+        self.save_kwargs = save_kwargs or {'dpi': dpi, 'facecolor': '#0a0a0a',
+                                           'edgecolor': 'none'}
+        self._saving = False
+        self.fig = None
+        self.artists = None
+        self.overlay = []
+        self.background = None
+        self.state = None
+        self.last_mode = None
+    
+    def render(self, times, temperatures, current_temp, humidity):
+        """Draw the chart, incrementally when the previous state allows it"""
+        times, temperatures = list(times), list(temperatures)
+        
+        if self._needs_full_render(times, temperatures, current_temp):
+            self._full_render(times, temperatures, current_temp, humidity)
+            self.last_mode = 'full'
+        else:
+            self._incremental_render(times, temperatures, current_temp, humidity)
+            self.last_mode = 'incremental'
+        
+        self.state = (times, temperatures, current_temp, humidity, datetime.now().date())
+        return self.fig
+    
+    def save(self, filename):
+        """Save the chart with the same output settings as a normal chart render"""
+        kwargs = self.save_kwargs
+        if kwargs.get('dpi') == self.fig.dpi:
+            # The live canvas already holds this image (up to the tight crop)
+            crop = self._buffer_crop()
+            if crop is not None:
+                image = np.asarray(self.fig.canvas.buffer_rgba())[crop]
+                plt.imsave(filename, image, dpi=self.fig.dpi)
+                return
+
+        # savefig skips animated artists: render them as ordinary ones. The
+        # cached background is untouched, so the next blit needs no redraw
+        dynamic = self._layer_artists()
+        self._saving = True
+        try:
+            for artist in dynamic:
+                artist.set_animated(False)
+            self.fig.savefig(filename, **kwargs)
+        finally:
+            for artist in dynamic:
+                artist.set_animated(True)
+            self._saving = False
+
+    def _buffer_crop(self):
+        """
+        Rows and columns of the canvas buffer that savefig would write, or
+        None when a tight bounding box reaches outside the canvas
+        """
+        if self.save_kwargs.get('bbox_inches') != 'tight':
+            return np.s_[:, :]
+
+        renderer = self.fig.canvas.get_renderer()
+        bbox = self.fig.get_tightbbox(renderer).padded(
+            self.save_kwargs.get('pad_inches', plt.rcParams['savefig.pad_inches']))
+        dpi = self.fig.dpi
+        width, height = self.fig.canvas.get_width_height()
+        # Same pixel size as savefig, which truncates the tight bbox; buffer
+        # rows run top to bottom, figure coordinates bottom to top
+        x0, y0 = round(bbox.x0 * dpi), round(height - bbox.y1 * dpi)
+        x1, y1 = x0 + int(bbox.width * dpi + 1e-8), y0 + int(bbox.height * dpi + 1e-8)
+        if x0 < 0 or y0 < 0 or x1 > width or y1 > height:
+            return None
+        return np.s_[y0:y1, x0:x1]
+    
+    def _dynamic_artists(self):
+        artists = self.artists
+        dynamic = (artists['segments'] + artists['glow_lines'] + [artists['scatter']]
+                   + artists['zones'] + artists['now_lines'] + [artists['dashboard']])
+        if artists['callout'] is not None:
+            dynamic.append(artists['callout'])
+        return dynamic
+    
+    def _layer_artists(self):
+        """Everything drawn over the cached background, data and overlay"""
+        return self._dynamic_artists() + self.overlay
+    
+    def _needs_full_render(self, times, temperatures, current_temp):
+        if self.fig is None:
+            return True
+        
+        # Long (merged, thinned or downsampled) series do not map readings
+        # to artists one-to-one
+        if len(times) > MAX_DETAIL_POINTS:
+            return True
+        
+        old_times, old_temps, old_current, _, day = self.state
+        if times != old_times or day != datetime.now().date():
+            return True
+        if bool(current_temp) != bool(old_current):
+            return True
+        
+        # The atmosphere bands in the cached background, the zones, segment
+        # colours and the autoscaled view all follow the day's range
+        if (min(temperatures), max(temperatures)) != (min(old_temps), max(old_temps)):
+            return True
+        
+        # New values must still fit inside the current view
+        ax = self.artists['ax']
+        y_low, y_high = ax.get_ylim()
+        values = temperatures + ([current_temp] if current_temp else [])
+        if min(values) - 1 < y_low or max(values) + 1 > y_high:
+            return True
+        x_low, x_high = ax.get_xlim()
+        if not x_low <= mdates.date2num(datetime.now()) <= x_high:
+            return True
+        
+        # Zones come and go with the spread of the readings
+        temp_min, temp_max, temp_avg = min(temperatures), max(temperatures), np.mean(temperatures)
+        zone_count = 2 * (temp_max > temp_avg + 1) + 2 * (temp_min < temp_avg - 1)
+        return zone_count != len(self.artists['zones'])
+    
+    def _full_render(self, times, temperatures, current_temp, humidity):
+        if self.fig is not None:
+            plt.close(self.fig)
+        
+        self.fig, self.artists = create_temperature_visualization(
+            times, temperatures, current_temp, humidity,
+            figsize=self.figsize, dpi=self.dpi, return_artists=True,
+            output_dpi=self.save_kwargs['dpi'])
+        
+        # Static artists stacked above the data (grid, spines, titles) join
+        # the animated layer, or redrawn data would paint over them
+        dynamic = self._dynamic_artists()
+        floor = min(artist.get_zorder() for artist in dynamic)
+        self.overlay = [child for child in self.artists['ax'].get_children()
+                        if child.get_zorder() > floor and child not in dynamic]
+        for artist in self._layer_artists():
+            artist.set_animated(True)
+        
+        # Pin the autoscaled view so later in-place updates cannot move it
+        ax = self.artists['ax']
+        ax.set_xlim(ax.get_xlim())
+        ax.set_ylim(ax.get_ylim())
+        
+        # Every full draw (including window resizes) refreshes the background
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+        self.fig.canvas.draw()
+    
+    def _on_draw(self, event):
+        if self._saving:
+            return
+        canvas = self.fig.canvas
+        self.background = canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_dynamic()
+    
+    def _draw_dynamic(self):
+        for artist in sorted(self._layer_artists(), key=lambda a: a.get_zorder()):
+            self.fig.draw_artist(artist)
+    
+    def _incremental_render(self, times, temperatures, current_temp, humidity):
+        artists = self.artists
+        canvas = self.fig.canvas
+        renderer = canvas.get_renderer()
+        
+        _, old_temps, _, _, _ = self.state
+        changed = [i for i, (old, new) in enumerate(zip(old_temps, temperatures)) if old != new]
+        temp_min, temp_max, temp_avg = min(temperatures), max(temperatures), np.mean(temperatures)
+        
+        # Artists whose data changes on this refresh
+        dirty = artists['now_lines'] + [artists['dashboard']]
+        if artists['callout'] is not None:
+            dirty.append(artists['callout'])
+        
+        segments = artists['segments']
+        # A reading shapes (and colours) the segments on either side of it;
+        # the day's range, which the colours are relative to, is unchanged
+        reshaped = sorted({j for i in changed for j in (i - 1, i) if 0 <= j < len(segments)})
+        dirty += [segments[j] for j in reshaped]
+        if changed:
+            dirty += artists['glow_lines'] + [artists['scatter']]
+        
+        old_boxes = [artist.get_window_extent(renderer) for artist in dirty]
+        
+        x = mdates.date2num(times)
+        for j in reshaped:
+            segments[j].set_verts([[(x[j], 0), (x[j], temperatures[j]),
+                                    (x[j+1], temperatures[j+1]), (x[j+1], 0)]])
+            segments[j].set_color(temp_to_color(temperatures[j], temp_min, temp_max))
+        
+        if changed:
+            for line in artists['glow_lines']:
+                line.set_ydata(temperatures)
+            artists['scatter'].set_offsets(np.column_stack([x, temperatures]))
+            artists['scatter'].set_facecolors(
+                [temp_to_color(t, temp_min, temp_max) for t in temperatures])
+        
+        current_time = datetime.now()
+        now_x = mdates.date2num(current_time)
+        for line in artists['now_lines']:
+            line.set_xdata([now_x, now_x])
+        if artists['callout'] is not None:
+            artists['callout'].xy = (current_time, current_temp)
+            artists['callout'].set_text(make_callout_text(current_temp, current_time))
+        artists['dashboard'].set_text(make_dashboard_text(
+            current_temp, temp_min, temp_max, temp_avg, humidity, current_time))
+        
+        new_boxes = [artist.get_window_extent(renderer) for artist in dirty]
+        dirty_region = Bbox.intersection(Bbox.union(old_boxes + new_boxes).padded(8),
+                                         self.fig.bbox)
+        
+        # Repaint the animated layer over the cached background and push
+        # only the dirty region to the screen
+        canvas.restore_region(self.background)
+        self._draw_dynamic()
+        canvas.blit(dirty_region)
+        canvas.flush_events()
+
+def watch_temperature(interval=60, width=None, height=None, dpi=300, output=None, show=True):
+    """
+    Refresh the chart every interval seconds, re-rendering incrementally
+    Saved files use the same size and dpi rules as a normal chart render.
+    Headless, the figure is drawn straight at the save dpi so each save just
+    copies the live canvas; on screen it is drawn at 150 dpi like main().
+    """
+    figsize, save_kwargs = chart_output_settings(width, height, dpi)
+    chart = IncrementalTemperatureChart(figsize=figsize,
+                                        dpi=150 if show else save_kwargs['dpi'],
+                                        save_kwargs=save_kwargs)
+    if show:
+        plt.ion()
+    
+    try:
+        while True:
+            data = fetch_hk_hourly_temperature()
+            if not (data[0] and data[1]):
+                data = make_demo_data()
+            
+            start = time.perf_counter()
+            fig = chart.render(*data)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{datetime.now().strftime('%H:%M:%S')} {chart.last_mode} render "
+                  f"in {elapsed:.0f} ms")
+            
+            if output:
+                chart.save(output)
+            if show:
+                fig.show()
+                plt.pause(interval)
+            else:
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        print("Stopped watching")
+    
+    return output
+
+def make_demo_data():
+    """Simulated day of readings for when the API is unavailable"""
+    current_time = datetime.now()
+    base_time = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    demo_times = [base_time + timedelta(hours=h) for h in range(24)]
+    demo_temps = [26 + 3*np.sin((h-6)*np.pi/12) + np.random.normal(0, 0.5) 
+                 for h in range(24)]
+    demo_current_temp = 26.5
+    demo_humidity = 75
+    
+    return demo_times, demo_temps, demo_current_temp, demo_humidity
+
+# Design size of the chart; fonts and layout are tuned for it
+CHART_FIGSIZE = (18, 10)
+
+def chart_output_settings(width=None, height=None, dpi=300):
+    """
+    Figure size and savefig options for a chart output
+    Without a pixel size the chart is saved at dpi with a tight bounding box.
+    With --width and/or --height the 18x10 design is kept and the save dpi is
+    derived from the width, so the PNG has exactly the requested pixels; a
+    lone width or height infers the other from the design aspect ratio.
+    """
+    design_w, design_h = CHART_FIGSIZE
+    save_kwargs = {'facecolor': '#0a0a0a', 'edgecolor': 'none'}
+    
+    if not (width or height):
+        save_kwargs.update(dpi=dpi, bbox_inches='tight', pad_inches=0.2)
+        return CHART_FIGSIZE, save_kwargs
+    
+    if not width:
+        width = round(height * design_w / design_h)
+    if not height:
+        height = round(width * design_h / design_w)
+    
+    save_dpi = width / design_w
+    figsize = (design_w, height / save_dpi)
+    if abs(width / height - design_w / design_h) > 0.01:
+        print(f"Warning: {width}x{height} differs from the chart's {design_w}:{design_h} "
+              f"aspect ratio; the layout may look cramped")
+    
+    # No tight bounding box: it would change the exact pixel size
+    save_kwargs['dpi'] = save_dpi
+    return figsize, save_kwargs
+
+def main(width=None, height=None, dpi=300, output=None, show=True, data=None):
     """Create the most beautiful Hong Kong temperature visualization"""
     
     print("HONG KONG TEMPERATURE ARTISTRY")
     print("=" * 50)
-    print("Fetching live weather data from Hong Kong Observatory...")
     
-    times, temperatures, current_temp, humidity = fetch_hk_hourly_temperature()
+    if data is None:
+        print("Fetching live weather data from Hong Kong Observatory...")
+        data = fetch_hk_hourly_temperature()
+    times, temperatures, current_temp, humidity = data
+    
+    figsize, save_kwargs = chart_output_settings(width, height, dpi)
     
     if times and temperatures:
         # Display key stats immediately
@@ -295,49 +788,49 @@ def main():
         print(f"Creating stunning visualization...")
         
         # Create the masterpiece
-        fig = create_temperature_visualization(times, temperatures, current_temp, humidity)
+        fig = create_temperature_visualization(times, temperatures, current_temp, humidity,
+                                               figsize=figsize,
+                                               output_dpi=save_kwargs['dpi'])
         
         # Save with beautiful filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M')
-        filename = f"hk_temperature_masterpiece_{timestamp}.png"
+        if output is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+            output = f"hk_temperature_masterpiece_{timestamp}.png"
         
-        plt.savefig(filename, dpi=300, bbox_inches='tight', 
-                   facecolor='#0a0a0a', edgecolor='none',
-                   pad_inches=0.2)
+        fig.savefig(output, **save_kwargs)
         
-        print(f"Masterpiece saved: {filename}")
+        print(f"Masterpiece saved: {output}")
         print(f"Ready to display your temperature art!")
         print("=" * 50)
         
-        # Show the beautiful visualization
-        plt.show()
-        
     else:
         print("Unable to fetch live data")
         print("Creating demo visualization with simulated data...")
         
         # Create demo data for when API is unavailable
-        current_time = datetime.now()
-        base_time = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        demo_times = [base_time + timedelta(hours=h) for h in range(24)]
-        demo_temps = [26 + 3*np.sin((h-6)*np.pi/12) + np.random.normal(0, 0.5) 
-                     for h in range(24)]
-        demo_current_temp = 26.5
-        demo_humidity = 75
+        demo_times, demo_temps, demo_current_temp, demo_humidity = make_demo_data()
         
         print(f"Demo Mode - Current: {demo_current_temp:.1f}°C")
         
         fig = create_temperature_visualization(demo_times, demo_temps, 
-                                             demo_current_temp, demo_humidity)
+                                             demo_current_temp, demo_humidity,
+                                             figsize=figsize,
+                                             output_dpi=save_kwargs['dpi'])
         
         # Save demo version
-        filename = f"hk_temperature_demo_{datetime.now().strftime('%Y%m%d_%H%M')}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight', 
-                   facecolor='#0a0a0a', edgecolor='none')
+        if output is None:
+            output = f"hk_temperature_demo_{datetime.now().strftime('%Y%m%d_%H%M')}.png"
+        fig.savefig(output, **save_kwargs)
         
-        print(f"Demo masterpiece saved: {filename}")
+        print(f"Demo masterpiece saved: {output}")
+    
+    # Show the beautiful visualization
+    if show:
         plt.show()
+    else:
+        plt.close(fig)
+    
+    return output
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,170 @@
+"""
+🌀 Hong Kong Temperature Julia Sets
+Each hour's temperature picks the c parameter of a Julia set
+
+All 24 panels are computed as one (24, H, W) stack through the same engines
+as the Mandelbrot renderer, then shown as a grid or played as an animation.
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation, PillowWriter
+from matplotlib.colors import LinearSegmentedColormap
+from datetime import datetime
+
+from mandelbrot import (fetch_hk_temperature, generate_temperature_pattern,
+                        compute_julia_batch)
+
+# Temperatures across this range sweep c once around the circle |c| = 0.7885,
+# which passes through many of the classic connected Julia sets
+JULIA_RADIUS = 0.7885
+TEMP_SPAN = (10, 35)
+
+# Narrowest animation frame (pixels) that still gets a caption
+MIN_CAPTION_WIDTH = 180
+
+JULIA_CMAP = LinearSegmentedColormap.from_list(
+    'temp_julia',
+    ['#000033', '#0066ff', '#00ffff', '#ffff00', '#ff6600', '#ff0000', '#ffffff']
+)
+
+def temperature_to_c(temps):
+    """Map temperatures (°C) to Julia c parameters on a circle"""
+    low, high = TEMP_SPAN
+    norm = (np.clip(np.asarray(temps, dtype=float), low, high) - low) / (high - low)
+    return JULIA_RADIUS * np.exp(2j * np.pi * norm)
+
+def create_julia_family(temps, width=300, height=300, max_iter=150,
+                        engine='numpy', workers=1, extent=1.6):
+    """Compute one Julia set per temperature as a (len(temps), H, W) stack"""
+    cs = temperature_to_c(temps)
+
+    aspect = height / width
+    x = np.linspace(-extent, extent, width)
+    y = np.linspace(-extent * aspect, extent * aspect, height)
+    X, Y = np.meshgrid(x, y)
+    Z = X + 1j*Y
+
+    print(f"🌀 Generating {len(cs)} Julia sets of {width}x{height} in one batch...")
+    stack = compute_julia_batch(Z, cs, max_iter, engine=engine, workers=workers)
+
+    return stack, cs
+
+def _style_panel(ax):
+    ax.set_xticks([])
+    ax.set_yticks([])
+    ax.set_facecolor('#1a1a1a')
+    for spine in ax.spines.values():
+        spine.set_color('white')
+        spine.set_alpha(0.7)
+
+def create_julia_grid(temps, width=300, height=300, max_iter=150,
+                      engine='numpy', workers=1, figsize=(24, 16), dpi=150):
+    """Draw the 24-hour Julia family as a 4x6 panel grid"""
+    stack, cs = create_julia_family(temps, width, height, max_iter,
+                                    engine=engine, workers=workers)
+
+    fig, axes = plt.subplots(4, 6, figsize=figsize, dpi=dpi)
+    fig.patch.set_facecolor('#0a0a0a')
+
+    for hour, (ax, panel, c, temp) in enumerate(zip(axes.flat, stack, cs, temps)):
+        ax.imshow(panel, cmap=JULIA_CMAP, origin='lower', interpolation='bilinear',
+                  vmin=0, vmax=max_iter)
+        ax.set_title(f'{hour:02d}:00 • {temp:.1f}°C\nc = {c.real:.3f}{c.imag:+.3f}i',
+                     fontsize=10, color='white')
+        _style_panel(ax)
+
+    fig.suptitle('Hong Kong Temperature Julia Family',
+                 fontsize=24, color='white', fontweight='bold')
+
+    plt.tight_layout()
+    plt.subplots_adjust(top=0.9)
+
+    return fig
+
+def create_julia_animation(temps, width=400, height=400, max_iter=150,
+                           engine='numpy', workers=1, fps=4, dpi=100):
+    """
+    Animate the Julia family through the day, one frame per hour
+    Frames are exactly width x height pixels: the image fills the figure one
+    Julia pixel per frame pixel, with the caption drawn over it
+    """
+    stack, cs = create_julia_family(temps, width, height, max_iter,
+                                    engine=engine, workers=workers)
+
+    fig = plt.figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    fig.patch.set_facecolor('#0a0a0a')
+    ax = fig.add_axes([0, 0, 1, 1])
+    _style_panel(ax)
+
+    im = ax.imshow(stack[0], cmap=JULIA_CMAP, origin='lower', aspect='auto',
+                   interpolation='nearest', vmin=0, vmax=max_iter)
+    # Caption scaled with the frame width; frames too small to read it
+    # (under MIN_CAPTION_WIDTH pixels) show the Julia set alone
+    title = ax.text(0.5, 0.98, '', transform=ax.transAxes, ha='center', va='top',
+                    fontsize=width / 36, color='white', fontweight='bold',
+                    bbox=dict(boxstyle='round', facecolor='#0a0a0a', alpha=0.6,
+                              edgecolor='none'),
+                    visible=width >= MIN_CAPTION_WIDTH)
+
+    def update(hour):
+        im.set_data(stack[hour])
+        c = cs[hour]
+        title.set_text(f'{hour:02d}:00 • {temps[hour]:.1f}°C • '
+                       f'c = {c.real:.3f}{c.imag:+.3f}i')
+        return im, title
+
+    update(0)
+    anim = FuncAnimation(fig, update, frames=len(stack), interval=1000 / fps, blit=False)
+
+    return fig, anim
+
+def main(width=None, height=None, max_iter=150, dpi=150, engine='numpy', workers=1,
+         output=None, show=True, current_temp=None, animate=False, fps=4,
+         figsize=(24, 16)):
+    """Render the temperature Julia family as a grid or animation"""
+
+    print("HONG KONG TEMPERATURE JULIA SETS")
+    print("=" * 50)
+
+    if current_temp is None:
+        print("Fetching live Hong Kong temperature data...")
+        current_temp = fetch_hk_temperature()
+    print(f"Current Hong Kong temperature: {current_temp:.1f}°C")
+
+    daily_temps = generate_temperature_pattern(current_temp)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+
+    # Panels are square unless both sides are given
+    default = 400 if animate else 300
+    width, height = width or height or default, height or width or default
+
+    if animate:
+        fig, anim = create_julia_animation(daily_temps, width, height,
+                                           max_iter, engine=engine, workers=workers,
+                                           fps=fps)
+        if output is None:
+            output = f"hk_temp_julia_{timestamp}.gif"
+        # Saved at the figure's own dpi: frames are width x height pixels
+        # and the still-image dpi does not apply
+        anim.save(output, writer=PillowWriter(fps=fps),
+                  savefig_kwargs={'facecolor': '#0a0a0a'})
+    else:
+        fig = create_julia_grid(daily_temps, width, height, max_iter,
+                                engine=engine, workers=workers, figsize=figsize)
+        if output is None:
+            output = f"hk_temp_julia_family_{timestamp}.png"
+        fig.savefig(output, dpi=dpi, bbox_inches='tight', facecolor='#0a0a0a')
+
+    print(f"Julia sets saved: {output}")
+    print("=" * 50)
+
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
+
+    return output
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,9 @@ from matplotlib.colors import LinearSegmentedColormap
 import requests
 from datetime import datetime, timedelta
 
+from engines import escape_iteration, compute_escape_time
+from station_field import interpolate_station_field
+
 def fetch_hk_temperature():
     """Fetch current Hong Kong temperature for fractal mapping"""
     try:
@@ -57,18 +60,39 @@ def generate_temperature_pattern(base_temp):
 
 def mandelbrot_iteration(c, max_iter=100):
     """Calculate Mandelbrot iterations for a complex number"""
-    z = 0
-    for n in range(max_iter):
-        if abs(z) > 2:
-            return n
-        z = z*z + c
-    return max_iter
+    return escape_iteration(0, c, max_iter)
+
+def compute_mandelbrot(C, max_iter=100, engine='numpy', workers=1):
+    """Compute Mandelbrot iteration counts for a complex grid via the engine registry"""
+    return compute_escape_time(0j, C, max_iter, engine=engine, workers=workers)
+
+def compute_julia_batch(Z, cs, max_iter=100, engine='numpy', workers=1):
+    """
+    Compute a stack of Julia sets in one pass
+    Z is the (H, W) complex grid and cs holds one c parameter per panel;
+    returns a (len(cs), H, W) array of iteration counts
+    """
+    cs = np.asarray(cs, dtype=complex)
+    return compute_escape_time(Z[None, :, :], cs[:, None, None], max_iter,
+                               engine=engine, workers=workers)
 
-def create_temperature_mandelbrot(temps, width=800, height=600, max_iter=100):
-    """Create Mandelbrot set colored by temperature data"""
+def create_temperature_mandelbrot(temps, width=800, height=600, max_iter=100,
+                                  engine='numpy', workers=1, temp_field=None):
+    """
+    Create Mandelbrot set colored by temperature data
+    If temp_field (a (height, width) spatial temperature grid) is given it
+    replaces the hour-of-day columns as the temperature overlay
+    """
     
     # Temperature statistics for mapping
-    temp_min, temp_max = np.min(temps), np.max(temps)
+    if temp_field is not None:
+        temp_field = np.asarray(temp_field, dtype=float)
+        if temp_field.shape != (height, width):
+            raise ValueError(f"temp_field shape {temp_field.shape} does not match "
+                             f"canvas {(height, width)}")
+        temp_min, temp_max = np.min(temp_field), np.max(temp_field)
+    else:
+        temp_min, temp_max = np.min(temps), np.max(temps)
     temp_range = temp_max - temp_min
     
     print(f"🌡️ Temperature Range: {temp_min:.1f}°C - {temp_max:.1f}°C")
@@ -93,16 +117,11 @@ def create_temperature_mandelbrot(temps, width=800, height=600, max_iter=100):
     C = X + 1j*Y
     
     # Calculate Mandelbrot set
-    mandelbrot_set = np.zeros((height, width))
+    print(f"🎨 Computing fractal iterations ({engine} engine, {workers} worker(s))...")
+    mandelbrot_set = compute_mandelbrot(C, max_iter, engine=engine, workers=workers)
     
-    print("🎨 Computing fractal iterations...")
-    for i in range(height):
-        for j in range(width):
-            mandelbrot_set[i, j] = mandelbrot_iteration(C[i, j], max_iter)
-        
-        if i % (height // 10) == 0:
-            progress = (i / height) * 100
-            print(f"   Progress: {progress:.0f}%")
+    if temp_field is not None:
+        return mandelbrot_set, temp_field, (temp_min, temp_max)
     
     # Temperature-based color mapping
     # Map 24 temperature values to fractal regions
@@ -117,19 +136,28 @@ def create_temperature_mandelbrot(temps, width=800, height=600, max_iter=100):
     
     return mandelbrot_set, temp_zones, (temp_min, temp_max)
 
-def create_temperature_mandelbrot_art(current_temp):
+def create_temperature_mandelbrot_art(current_temp, width=1200, height=900, max_iter=150,
+                                      engine='numpy', workers=1, figsize=(20, 16), dpi=150,
+                                      station_readings=None, field_method='idw'):
     """Create the ultimate temperature-Mandelbrot artistic fusion"""
     
     # Generate temperature pattern
     daily_temps = generate_temperature_pattern(current_temp)
     
+    # Optional spatial overlay interpolated from every reporting station
+    temp_field = None
+    if station_readings is not None:
+        temp_field = interpolate_station_field(station_readings, width, height,
+                                               method=field_method)
+    
     # Create Mandelbrot fractal influenced by temperature
     mandelbrot_data, temp_zones, temp_range = create_temperature_mandelbrot(
-        daily_temps, width=1200, height=900, max_iter=150
+        daily_temps, width=width, height=height, max_iter=max_iter,
+        engine=engine, workers=workers, temp_field=temp_field
     )
     
     # Setup the artistic visualization
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16), dpi=150)
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=figsize, dpi=dpi)
     fig.patch.set_facecolor('#0a0a0a')
     
     # 1. Classic Mandelbrot with temperature colors
@@ -168,7 +196,11 @@ def create_temperature_mandelbrot_art(current_temp):
     
     # 3. Hybrid fractal-temperature fusion
     # Blend Mandelbrot iterations with temperature data
-    hybrid_data = mandelbrot_data * 0.7 + (temp_zones - temp_range[0]) / (temp_range[1] - temp_range[0]) * 50
+    # A flat overlay (one station, or identical readings) has no range to
+    # normalise by, so it sits in the middle like in temp_to_color
+    span = temp_range[1] - temp_range[0]
+    temp_norm = (temp_zones - temp_range[0]) / span if span else np.full_like(temp_zones, 0.5)
+    hybrid_data = mandelbrot_data * 0.7 + temp_norm * 50
     
     fusion_cmap = LinearSegmentedColormap.from_list(
         'fusion',
@@ -241,35 +273,52 @@ def create_temperature_mandelbrot_art(current_temp):
     
     return fig, daily_temps
 
-def main():
-    """Create temperature-Mandelbrot fusion masterpiece"""
+def main(width=1200, height=900, max_iter=150, dpi=300, engine='numpy', workers=1,
+         output=None, show=True, current_temp=None, station_readings=None,
+         field_method='idw', figsize=(20, 16)):
+    """
+    Create temperature-Mandelbrot fusion masterpiece
+    width and height size the fractal canvas; the saved image is about
+    figsize inches at dpi, whatever the canvas size
+    """
     
     print("HONG KONG TEMPERATURE MANDELBROT ART GENERATOR")
     print("=" * 60)
-    print("Fetching live Hong Kong temperature data...")
     
-    current_temp = fetch_hk_temperature()
+    if current_temp is None:
+        print("Fetching live Hong Kong temperature data...")
+        current_temp = fetch_hk_temperature()
     print(f"Current Hong Kong temperature: {current_temp:.1f}°C")
     print("Generating fractal temperature fusion art...")
     print("This may take a few minutes due to fractal calculations...")
     
     # Create the masterpiece
-    fig, temps = create_temperature_mandelbrot_art(current_temp)
+    fig, temps = create_temperature_mandelbrot_art(
+        current_temp, width=width, height=height, max_iter=max_iter,
+        engine=engine, workers=workers, figsize=figsize,
+        station_readings=station_readings, field_method=field_method
+    )
     
     # Save with beautiful filename
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M')
-    filename = f"hk_temp_mandelbrot_fusion_{timestamp}.png"
+    if output is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+        output = f"hk_temp_mandelbrot_fusion_{timestamp}.png"
     
-    plt.savefig(filename, dpi=300, bbox_inches='tight', 
-               facecolor='#0a0a0a', pad_inches=0.2)
+    fig.savefig(output, dpi=dpi, bbox_inches='tight', 
+                facecolor='#0a0a0a', pad_inches=0.2)
     
-    print(f"Mandelbrot fusion masterpiece saved: {filename}")
+    print(f"Mandelbrot fusion masterpiece saved: {output}")
     print(f"Temperature range: {np.min(temps):.1f}°C - {np.max(temps):.1f}°C")
     print("Mathematical beauty meets meteorological data!")
     print("=" * 60)
     
     # Display the art
-    plt.show()
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
+    
+    return output
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,327 @@
+"""
+🗺️ Hong Kong Spatial Temperature Field
+Interpolates readings from every HKO weather station onto a regular grid
+
+The expensive part of interpolation (station-to-grid distances and weights)
+only depends on which stations reported and on the grid, not on the readings.
+Weights are therefore computed once per station set and cached, so refreshing
+the map with new readings is a single sparse matrix-vector product.
+"""
+
+import sys
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.colors import LinearSegmentedColormap
+from datetime import datetime
+
+from data_fetcher import fetch_hk_station_temperatures
+
+# Approximate station locations (latitude, longitude) for the temperature
+# stations reported by the rhrread endpoint
+STATION_COORDS = {
+    "King's Park": (22.312, 114.173),
+    'Hong Kong Observatory': (22.302, 114.174),
+    'Wong Chuk Hang': (22.248, 114.174),
+    'Ta Kwu Ling': (22.529, 114.157),
+    'Lau Fau Shan': (22.469, 113.984),
+    'Tai Po': (22.446, 114.179),
+    'Sha Tin': (22.402, 114.210),
+    'Tuen Mun': (22.386, 113.964),
+    'Tseung Kwan O': (22.316, 114.256),
+    'Sai Kung': (22.376, 114.275),
+    'Cheung Chau': (22.201, 114.027),
+    'Chek Lap Kok': (22.310, 113.922),
+    'Tsing Yi': (22.344, 114.110),
+    'Shek Kong': (22.436, 114.085),
+    'Tsuen Wan Ho Koon': (22.383, 114.108),
+    'Tsuen Wan Shing Mun Valley': (22.375, 114.127),
+    'Hong Kong Park': (22.278, 114.162),
+    'Shau Kei Wan': (22.282, 114.236),
+    'Kowloon City': (22.335, 114.185),
+    'Happy Valley': (22.270, 114.184),
+    'Wong Tai Sin': (22.339, 114.206),
+    'Stanley': (22.214, 114.219),
+    'Kwun Tong': (22.319, 114.225),
+    'Sham Shui Po': (22.336, 114.137),
+    'Kai Tak Runway Park': (22.304, 114.217),
+    'Yuen Long Park': (22.441, 114.018),
+    'Tai Mei Tuk': (22.475, 114.238),
+}
+
+# Map window covering the territory: (lon_min, lon_max, lat_min, lat_max)
+HK_BOUNDS = (113.82, 114.45, 22.13, 22.58)
+
+KM_PER_DEG_LAT = 110.57
+KM_PER_DEG_LON = 111.32 * np.cos(np.radians(22.35))
+
+METHODS = ('idw', 'rbf')
+
+def _to_km(lat, lon):
+    """Project lat/lon onto a flat local grid in kilometres"""
+    return np.column_stack([np.asarray(lon) * KM_PER_DEG_LON,
+                            np.asarray(lat) * KM_PER_DEG_LAT])
+
+# Grid cells handled per block while building weights, so only a
+# (block x stations) distance matrix is ever held at once
+BLOCK_CELLS = 65536
+
+def _distances(a, b):
+    """Pairwise distances between two point sets"""
+    return np.hypot(a[:, None, 0] - b[None, :, 0], a[:, None, 1] - b[None, :, 1])
+
+def _blocks(n, size=BLOCK_CELLS):
+    """Slices covering range(n) in blocks of at most size"""
+    return [slice(start, start + size) for start in range(0, n, size)]
+
+def _grid_points(width, height, bounds):
+    """Grid cell centres, row 0 at the southern edge (for origin='lower')"""
+    lon_min, lon_max, lat_min, lat_max = bounds
+    lon = np.linspace(lon_min, lon_max, width)
+    lat = np.linspace(lat_min, lat_max, height)
+    LON, LAT = np.meshgrid(lon, lat)
+    return _to_km(LAT.ravel(), LON.ravel())
+
+class FieldInterpolator:
+    """
+    Precomputed station-to-grid weights for one station set and grid
+
+    IDW weights are stored in ELLPACK form: every grid cell keeps the column
+    indices and weights of its nearest stations, so evaluating the field is
+    one sparse matrix-vector product. RBF weights couple every cell to every
+    station and are kept as a dense matrix.
+    """
+
+    def __init__(self, stations, width, height, bounds=HK_BOUNDS,
+                 method='idw', neighbors=8, power=2.0, length_scale=8.0, smoothing=0.3):
+        if method not in METHODS:
+            raise ValueError(f"Unknown method '{method}', choose from {METHODS}")
+        missing = [name for name in stations if name not in STATION_COORDS]
+        if missing:
+            raise ValueError(f"No coordinates for station(s): {missing}")
+
+        self.stations = tuple(stations)
+        self.shape = (height, width)
+        self.bounds = bounds
+
+        coords = np.array([STATION_COORDS[name] for name in self.stations])
+        station_xy = _to_km(coords[:, 0], coords[:, 1])
+        grid_xy = _grid_points(width, height, bounds)
+
+        if method == 'idw':
+            self.indices, self.weights = self._idw_weights(
+                grid_xy, station_xy, neighbors, power)
+        else:
+            self.indices, self.weights = self._rbf_weights(
+                grid_xy, station_xy, length_scale, smoothing)
+
+    @staticmethod
+    def _idw_weights(grid_xy, station_xy, neighbors, power):
+        """Inverse-distance weights over each cell's nearest stations"""
+        k = min(neighbors, len(station_xy))
+        indices = np.empty((len(grid_xy), k), dtype=np.int32)
+        near = np.empty((len(grid_xy), k))
+
+        # Nearest-k station columns per cell (the KD-tree query, brute force
+        # is plenty for a few dozen stations), one block of cells at a time
+        for rows in _blocks(len(grid_xy)):
+            dist = _distances(grid_xy[rows], station_xy)
+            indices[rows] = np.argpartition(dist, k - 1, axis=1)[:, :k]
+            near[rows] = np.take_along_axis(dist, indices[rows], axis=1)
+
+        # A cell sitting on a station takes that station's reading exactly
+        exact = near < 1e-6
+        # Turn distances into weights in place: no second full-size array
+        weights = np.maximum(near, 1e-6, out=near)
+        np.power(weights, -power, out=weights)
+        on_station = exact.any(axis=1)
+        weights[on_station] = exact[on_station]
+        weights /= weights.sum(axis=1, keepdims=True)
+
+        return indices, weights
+
+    @staticmethod
+    def _rbf_weights(grid_xy, station_xy, length_scale, smoothing):
+        """
+        Smoothed Gaussian RBF weights that relax to the station mean far from data
+        Stations can sit about 1 km apart (Hong Kong Observatory and King's
+        Park), which makes the bare kernel matrix near-singular and the exact
+        interpolant wildly overshoot; the smoothing (nugget) term trades exact
+        fits at the stations for a well-conditioned, bounded solve. Where
+        neighbouring stations disagree the field can sit about a degree off
+        a station's own reading; IDW is exact at every station
+        """
+        n = len(station_xy)
+
+        def kernel(a, b):
+            return np.exp(-(_distances(a, b) / length_scale) ** 2)
+
+        # Interpolate anomalies from the mean: field = mean + K_gs A^-1 (v - mean)
+        A = kernel(station_xy, station_xy) + smoothing * np.eye(n)
+        A_inv = np.linalg.solve(A, np.eye(n))
+        W = np.empty((len(grid_xy), n))
+        for rows in _blocks(len(grid_xy)):
+            block = kernel(grid_xy[rows], station_xy) @ A_inv
+            W[rows] = block - block.sum(axis=1, keepdims=True) / n + 1.0 / n
+
+        # Every cell depends on every station: keep the dense matrix
+        return None, W
+
+    def __call__(self, values, clip=True):
+        """Evaluate the field for readings ordered like ``self.stations``"""
+        values = np.asarray(values, dtype=float)
+        if self.indices is None:
+            field = self.weights @ values
+        else:
+            field = np.einsum('ij,ij->i', self.weights, values[self.indices])
+        # Never show temperatures no station reported (IDW is already
+        # bounded; RBF can still overshoot slightly between stations)
+        if clip:
+            field = np.clip(field, values.min(), values.max())
+        return field.reshape(self.shape)
+
+# Interpolators hold a weight matrix per grid cell (an RBF one at 1200x900 is
+# about 230 MB), so only the most recent few are kept
+_INTERPOLATOR_CACHE = {}
+_INTERPOLATOR_CACHE_SIZE = 4
+
+def get_interpolator(stations, width, height, bounds=HK_BOUNDS, method='idw', **params):
+    """Return a cached interpolator for this station set and grid"""
+    key = (tuple(sorted(stations)), width, height, bounds, method,
+           tuple(sorted(params.items())))
+    interpolator = _INTERPOLATOR_CACHE.get(key)
+    if interpolator is None:
+        interpolator = FieldInterpolator(key[0], width, height, bounds=bounds,
+                                         method=method, **params)
+        if len(_INTERPOLATOR_CACHE) >= _INTERPOLATOR_CACHE_SIZE:
+            _INTERPOLATOR_CACHE.pop(next(iter(_INTERPOLATOR_CACHE)))
+        _INTERPOLATOR_CACHE[key] = interpolator
+    return interpolator
+
+def interpolate_station_field(readings, width=200, height=150, bounds=HK_BOUNDS,
+                              method='idw', **params):
+    """
+    Interpolate a {station: temperature} dict onto a (height, width) grid
+    Stations without known coordinates are ignored
+    """
+    known = {name: temp for name, temp in readings.items() if name in STATION_COORDS}
+    if not known:
+        raise ValueError("No readings from stations with known coordinates")
+
+    interpolator = get_interpolator(known.keys(), width, height,
+                                    bounds=bounds, method=method, **params)
+    return interpolator([known[name] for name in interpolator.stations])
+
+# Largest unclipped RBF excursion beyond the readings the check accepts (°C)
+RBF_TOLERANCE = 0.25
+
+def check_field_within_readings(trials=20, width=80, height=60, seed=0):
+    """
+    Sanity check: for noisy readings at every known station, each method's
+    unclipped field must stay within the [min, max] of the readings (IDW
+    exactly, RBF within RBF_TOLERANCE)
+    Returns the worst (low, high) excursion seen; raises AssertionError on failure
+    """
+    rng = np.random.default_rng(seed)
+    worst = (0.0, 0.0)
+    tolerance = {'idw': 1e-9, 'rbf': RBF_TOLERANCE}
+
+    for _ in range(trials):
+        readings = {name: 27 + rng.normal(0, 1) for name in STATION_COORDS}
+        low, high = min(readings.values()), max(readings.values())
+        for method in METHODS:
+            interpolator = get_interpolator(readings.keys(), width, height, method=method)
+            field = interpolator([readings[name] for name in interpolator.stations], clip=False)
+            assert (field.min() >= low - tolerance[method]
+                    and field.max() <= high + tolerance[method]), \
+                (f"{method} field {field.min():.2f}..{field.max():.2f}°C leaves "
+                 f"readings range {low:.2f}..{high:.2f}°C")
+            worst = (min(worst[0], field.min() - low), max(worst[1], field.max() - high))
+
+    return worst
+
+def create_station_heatmap(readings, width=400, height=300, method='idw',
+                           figsize=(14, 10), dpi=150):
+    """
+    Draw the interpolated temperature field with station markers
+    Markers are labelled with the raw readings: IDW colours match them
+    exactly, RBF colours are a smoothed fit and can differ by about a degree
+    """
+    field = interpolate_station_field(readings, width, height, method=method)
+    lon_min, lon_max, lat_min, lat_max = HK_BOUNDS
+
+    fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+    fig.patch.set_facecolor('#0a0a0a')
+    ax.set_facecolor('#1a1a1a')
+
+    temp_cmap = LinearSegmentedColormap.from_list(
+        'hk_temps',
+        ['#4a90e2', '#f39c12', '#e74c3c']  # Cool blue to warm red
+    )
+
+    im = ax.imshow(field, extent=[lon_min, lon_max, lat_min, lat_max],
+                   cmap=temp_cmap, origin='lower', interpolation='bilinear',
+                   aspect=KM_PER_DEG_LAT / KM_PER_DEG_LON)
+
+    # Station markers with their readings
+    for name, temp in readings.items():
+        if name not in STATION_COORDS:
+            continue
+        lat, lon = STATION_COORDS[name]
+        ax.scatter(lon, lat, s=40, color='white', edgecolors='black', zorder=5)
+        ax.annotate(f'{temp:.1f}', xy=(lon, lat), xytext=(4, 4),
+                    textcoords='offset points', color='white', fontsize=8)
+
+    cbar = plt.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
+    cbar.set_label('Temperature (°C)', color='white')
+    cbar.ax.yaxis.set_tick_params(color='white')
+
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
+    ax.set_title(f'Hong Kong Temperature Field ({method.upper()}) • {timestamp}',
+                 fontsize=16, color='white', fontweight='bold')
+    ax.set_xlabel('Longitude', color='white')
+    ax.set_ylabel('Latitude', color='white')
+    ax.tick_params(colors='white')
+    for spine in ax.spines.values():
+        spine.set_color('white')
+        spine.set_alpha(0.7)
+
+    plt.tight_layout()
+    return fig
+
+def main(width=400, height=300, method='idw', dpi=300, output=None, show=True,
+         readings=None, figsize=(14, 10)):
+    """Render a live Hong Kong temperature heatmap"""
+
+    print("HONG KONG TEMPERATURE FIELD")
+    print("=" * 50)
+
+    if readings is None:
+        print("Fetching station readings from Hong Kong Observatory...")
+        readings = fetch_hk_station_temperatures()
+    if not readings:
+        raise ValueError("No station readings available from Hong Kong Observatory")
+    print(f"Stations reporting: {len(readings)}")
+
+    fig = create_station_heatmap(readings, width=width, height=height, method=method,
+                                 figsize=figsize)
+
+    if output is None:
+        output = f"hk_temperature_field_{datetime.now().strftime('%Y%m%d_%H%M')}.png"
+    fig.savefig(output, dpi=dpi, bbox_inches='tight', facecolor='#0a0a0a')
+    print(f"Temperature field saved: {output}")
+
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
+
+    return output
+
+if __name__ == "__main__":
+    if '--check' in sys.argv:
+        low, high = check_field_within_readings()
+        print("Station field check passed: IDW and RBF stay within the readings "
+              f"(worst excursion {low:+.2f} / {high:+.2f}°C before clipping)")
+    else:
+        main()